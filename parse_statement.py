@@ -1,83 +1,134 @@
-import re
+import mmap
+import os
 import sys
+
+try:
+    # RE2's Thompson-NFA engine matches in linear time regardless of
+    # input, closing the ReDoS surface for good. Its wrapper is not fully
+    # re-compatible: flags like MULTILINE don't exist (hence the inline
+    # (?m) in the pattern), a bytes pattern's groupindex is keyed by
+    # bytes, and only bytes/str buffers are accepted - all handled below
+    # (pip install google-re2).
+    import re2 as re
+    _USING_RE2 = True
+except ImportError:
+    # Stdlib backtracking engine; safe here because the pattern below is
+    # written to be unambiguous (see the note on the description class).
+    import re
+    _USING_RE2 = False
 import argparse
-from typing import List, Dict
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import List
+
+# Compiled once at import so parse_multiple_files doesn't recompile the
+# pattern for every file.
+#
+# Anchored per line (inline (?m), which both engines understand) so one
+# findall call scans the whole buffer inside the C regex engine instead
+# of a Python loop over splitlines. The description class excludes '%'
+# and '$' (the characters that start the trailing tokens) and is bounded
+# in length, so the pattern can't backtrack super-linearly on malformed
+# lines.
+_BILLING_RE = re.compile(
+    rb"(?m)^(?P<date>\d{2}/\d{2}/\d{4})\s+"          # Date in MM/DD/YYYY format
+    rb"(?P<description>[^%$\n]{1,200}?)\s+"          # Description (no '%'/'$', bounded)
+    rb"(?P<cashback_percentage>-?\d+%)\s+"           # Cash-back percentage (can be negative)
+    rb"(?P<cashback_sign>[-+]?)\$(?P<cashback_amount>[\d\.]+)\s+"  # Optional sign before cashback amount
+    rb"(?P<total_sign>[-+]?)\$(?P<total>[\d\.]+)\r?$"             # Optional sign before total amount
+)
+
+# One transaction row. A namedtuple keeps the field names without paying
+# for a 5-key dict allocation per matched line.
+Txn = namedtuple('Txn', 'date description cashback_percentage cashback_amount total')
 
-def convert_date_to_iso(date: str) -> str:
+def _compile_row_processor():
     """
-    Converts a date from MM/DD/YYYY to YYYY-MM-DD using string manipulation.
-    
-    Args:
-        date (str): Date in MM/DD/YYYY format.
-    
+    Generates the batch findall-tuples -> Txn-list function at import time.
+
+    findall already builds one plain tuple per match inside the regex
+    engine, so the only Python-level work left per row is decoding and
+    sign/date fix-up. That residue is emitted here as a single list
+    comprehension - no per-row function call, no match objects - with the
+    tuple unpack order derived from _BILLING_RE.groupindex so it tracks
+    the pattern, and Txn pre-bound as a default argument.
+
     Returns:
-        str: Date in YYYY-MM-DD format.
+        callable: _txns_from_rows(rows) -> List[Txn].
     """
-    month, day, year = date.split('/')
-    return f"{year}-{month}-{day}"
+    g = _BILLING_RE.groupindex
+    # google-re2 keys a bytes pattern's groupindex with bytes names.
+    names = [n.decode() if isinstance(n, bytes) else n
+             for n in sorted(g, key=g.get)]
+    source = (
+        "def _txns_from_rows(rows, _Txn=Txn):\n"
+        "    return [\n"
+        "        _Txn(\n"
+        "            date[6:10].decode() + '-' + date[0:2].decode() + '-' + date[3:5].decode(),\n"
+        "            description.decode(),\n"
+        "            cashback_percentage.decode(),\n"
+        "            (b'-' + cashback_amount if cashback_sign == b'-' else cashback_amount).decode(),\n"
+        "            (b'-' + total if total_sign == b'-' else total).decode(),\n"
+        "        )\n"
+        f"        for {', '.join(names)} in rows\n"
+        "    ]\n"
+    )
+    namespace = {'Txn': Txn}
+    exec(source, namespace)
+    return namespace['_txns_from_rows']
 
-def parse_billing_data(data: str) -> List[Dict]:
+_txns_from_rows = _compile_row_processor()
+
+def parse_billing_data(data) -> List[Txn]:
     """
-    Parses raw billing data text and extracts transactions including cash-back information,
+    Parses raw billing data and extracts transactions including cash-back information,
     converting dates to ISO 8601 format using string manipulation.
     
     Args:
-        data (str): Raw billing data as a string.
+        data (bytes or mmap.mmap): Raw billing data as a bytes-like buffer.
     
     Returns:
-        List[Dict]: List of parsed transactions as dictionaries.
+        List[Txn]: List of parsed transactions as Txn namedtuples.
     """
-    # Updated pattern to capture the sign before the amount
-    pattern = re.compile(
-        r"(?P<date>\d{2}/\d{2}/\d{4})\s+"               # Date in MM/DD/YYYY format
-        r"(?P<description>.+?)\s+"                      # Description (allow flexibility)
-        r"(?P<cashback_percentage>-?\d+%)\s+"           # Cash-back percentage (can be negative)
-        r"(?P<cashback_sign>[-+]?)\$(?P<cashback_amount>[\d\.]+)\s+"  # Optional sign before cashback amount
-        r"(?P<total_sign>[-+]?)\$(?P<total>[\d\.]+)"                 # Optional sign before total amount
-    )
-    
-    transactions = []
-    
-    lines = data.strip().split("\n")
-    
-    for line in lines:
-        match = pattern.match(line)
-        if match:
-            transaction = match.groupdict()
-            
-            # Convert the date using string manipulation
-            transaction['date'] = convert_date_to_iso(transaction['date'])
-            
-            # Apply the sign to the cashback_amount
-            if transaction['cashback_sign'] == '-':
-                transaction['cashback_amount'] = f"-{transaction['cashback_amount']}"
-            
-            # Apply the sign to the total
-            if transaction['total_sign'] == '-':
-                transaction['total'] = f"-{transaction['total']}"
-            
-            # Remove the sign keys as they are now integrated into the amount values
-            del transaction['cashback_sign']
-            del transaction['total_sign']
-            
-            transactions.append(transaction)
-    
-    return transactions
+    # One C-level scan of the whole buffer; with an mmap'd file the OS
+    # pages in only what the regex touches and nothing is copied up front.
+    # findall hands back ready-made group tuples, and the generated batch
+    # processor finishes the rows in one comprehension.
+    if _USING_RE2 and not isinstance(data, bytes):
+        # google-re2 only takes bytes/str, not mmap buffers; one copy
+        # buys the linear-time scan.
+        data = bytes(data)
+    return _txns_from_rows(_BILLING_RE.findall(data))
 
-def read_file(file_path: str) -> str:
+def read_file(file_path: str):
     """
-    Reads the raw text file and returns its contents.
-    
+    Maps the statement file into memory and returns a scannable buffer.
+
+    mmap avoids the full-size read() copy (plus the strip/split copies the
+    old line-based parser made); the regex scans the kernel's page cache
+    directly.
+
     Args:
         file_path (str): Path to the file to be read.
-    
+
     Returns:
-        str: Contents of the file as a string.
+        mmap.mmap or bytes: Read-only view of the file contents.
     """
-    with open(file_path, 'r') as file:
-        return file.read()
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""  # mmap rejects empty files
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Ask the kernel to start reading the whole file in now, without
+        # blocking. With several files mapped up front their prefetches
+        # run concurrently, so on high-latency storage the wait
+        # approaches the slowest single file instead of the sum of all
+        # of them.
+        if hasattr(mmap, 'MADV_WILLNEED'):
+            mapped.madvise(mmap.MADV_WILLNEED)
+        return mapped
 
-def parse_multiple_files(file_paths: List[str]) -> List[Dict]:
+def parse_multiple_files(file_paths: List[str]) -> List[Txn]:
     """
     Parses multiple files and returns the combined list of transactions.
     
@@ -85,16 +136,18 @@ def parse_multiple_files(file_paths: List[str]) -> List[Dict]:
         file_paths (List[str]): List of file paths to be read and parsed.
     
     Returns:
-        List[Dict]: Combined list of parsed transactions.
+        List[Txn]: Combined list of parsed transactions (in file order).
     """
-    all_transactions = []
-    
-    for file_path in file_paths:
-        raw_data = read_file(file_path)
-        transactions = parse_billing_data(raw_data)
-        all_transactions.extend(transactions)
-    
-    return all_transactions
+    # Note: stdlib re holds the GIL for the whole match, so the scans
+    # themselves do NOT run in parallel under the default install (they do
+    # when google-re2 is active, which matches outside the GIL). What the
+    # pool buys either way is getting every file mapped and its
+    # MADV_WILLNEED readahead issued early, so the kernel prefetches later
+    # files while earlier ones are being scanned. _BILLING_RE is compiled
+    # once at module scope and is safe to share across threads.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(lambda path: parse_billing_data(read_file(path)), file_paths)
+        return list(chain.from_iterable(results))
 
 def main():
     parser = argparse.ArgumentParser(description="Parse billing statement files.")
@@ -113,9 +166,12 @@ def main():
     # Parse the files and collect all transactions
     all_transactions = parse_multiple_files(args.files)
     
-    # Output the parsed transactions to the terminal
-    for transaction in all_transactions:
-        print(transaction)
+    # Output the parsed transactions in one buffered write; per-row print
+    # would pay a lock acquisition and a syscall per transaction, which
+    # dominates when output is redirected to a file.
+    if all_transactions:
+        sys.stdout.write("\n".join(map(repr, all_transactions)))
+        sys.stdout.write("\n")
 
 if __name__ == "__main__":
     main()